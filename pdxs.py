@@ -8,9 +8,16 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import threading
+import queue
+from collections import defaultdict
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed, wait, FIRST_COMPLETED)
+import numpy as np
 import pandas as pd
 import json
 import csv
+import io
+import mmap
 from datetime import datetime
 import os
 
@@ -32,10 +39,244 @@ except ImportError:
 # For XML/HTML
 try:
     from bs4 import BeautifulSoup
+    from bs4.element import Tag
+    BS4_SUPPORT = True
+except ImportError:
+    BS4_SUPPORT = False
+
+try:
     import lxml
-    XML_SUPPORT = True
+    LXML_SUPPORT = True
+except ImportError:
+    LXML_SUPPORT = False
+
+XML_SUPPORT = BS4_SUPPORT and LXML_SUPPORT
+
+# For faster Excel writing
+try:
+    import xlsxwriter
+    XLSXWRITER_SUPPORT = True
+except ImportError:
+    XLSXWRITER_SUPPORT = False
+
+# For fast CSV/TSV parsing
+try:
+    import pyarrow.csv as pacsv
+    PYARROW_SUPPORT = True
+except ImportError:
+    PYARROW_SUPPORT = False
+
+# For fast JSON parsing
+try:
+    import orjson
+    ORJSON_SUPPORT = True
 except ImportError:
-    XML_SUPPORT = False
+    ORJSON_SUPPORT = False
+
+# For JIT-compiled hot loops
+try:
+    import numba
+    NUMBA_SUPPORT = True
+except ImportError:
+    NUMBA_SUPPORT = False
+
+# For Rust-backed DataFrame reading/writing
+try:
+    import polars as pl
+    POLARS_SUPPORT = True
+except ImportError:
+    POLARS_SUPPORT = False
+
+
+# CSV inputs above this size are streamed chunk by chunk instead of loaded whole
+LARGE_CSV_BYTES = 50 * 1024 * 1024
+CSV_CHUNK_ROWS = 50_000
+
+
+def _source_size(source):
+    """Size in bytes of a path or seekable file-like source"""
+    if hasattr(source, 'seek'):
+        pos = source.tell()
+        size = source.seek(0, os.SEEK_END)
+        source.seek(pos)
+        return size
+    return os.path.getsize(source)
+
+
+def _rewind(source):
+    """Reset a file-like source so it can be parsed again"""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def _mmap_source(path):
+    """Memory-map a file so parsers page in only the bytes they touch"""
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _page_rows_from_words(page, vertical_lines, y_tolerance=5):
+    """Build table rows from one extract_words pass over a page.
+
+    pdfplumber's table detection re-walks every character on each call;
+    extracting the words once and bucketing them is much cheaper. Words
+    are grouped into rows by y position and assigned to columns with a
+    single binary search over the explicit vertical boundaries.
+    """
+    words = page.extract_words(x_tolerance=3, y_tolerance=y_tolerance,
+                               use_text_flow=True)
+    if not words:
+        return []
+
+    n_cols = len(vertical_lines) - 1
+    xs = np.fromiter((w['x0'] for w in words), dtype=float, count=len(words))
+    col_indices = np.searchsorted(vertical_lines, xs, side='right') - 1
+
+    cells = defaultdict(list)  # (row bucket, column) -> word texts
+    for word, col in zip(words, col_indices):
+        if 0 <= col < n_cols:
+            cells[(round(word['top'] / y_tolerance), col)].append(word['text'])
+
+    buckets = sorted({key[0] for key in cells})
+    return [
+        [' '.join(cells[(b, c)]) if (b, c) in cells else None
+         for c in range(n_cols)]
+        for b in buckets
+    ]
+
+
+def _extract_page_rows(pdf_source, page_no, table_settings):
+    """Extract and merge statement rows from one page of a PDF.
+
+    Top-level (picklable) and opens the PDF itself so pages can be
+    processed in parallel worker processes. `pdf_source` is either a
+    path or the document's bytes (from the GUI prefetcher).
+    """
+    import pdfplumber
+
+    if isinstance(pdf_source, bytes):
+        pdf_source = io.BytesIO(pdf_source)
+    elif isinstance(pdf_source, (str, os.PathLike)):
+        pdf_source = _mmap_source(pdf_source)
+
+    with pdfplumber.open(pdf_source) as pdf:
+        page = pdf.pages[page_no]
+
+        rows = _merge_statement_table(
+            _page_rows_from_words(page, table_settings["explicit_vertical_lines"])
+        )
+
+        if not rows:
+            # Fall back to full table detection for pages the word
+            # bucketing cannot handle
+            for table in page.extract_tables(table_settings=table_settings):
+                rows.extend(_merge_statement_table(table))
+
+        return rows
+
+
+if NUMBA_SUPPORT:
+    @numba.njit(cache=True)
+    def _segment_starts(is_main):
+        """Indices where merge segments begin (JIT-compiled)"""
+        n = 0
+        for i in range(is_main.size):
+            if is_main[i]:
+                n += 1
+        out = np.empty(n, np.int64)
+        k = 0
+        for i in range(is_main.size):
+            if is_main[i]:
+                out[k] = i
+                k += 1
+        return out
+else:
+    def _segment_starts(is_main):
+        """Indices where merge segments begin"""
+        return np.flatnonzero(is_main)
+
+
+def _merge_statement_table(table):
+    """Merge one raw extracted statement table into main rows.
+
+    Vectorized replacement for the old row-by-row scan: continuation rows
+    (Details text with every other column empty) are folded into the
+    preceding main row, joined with newlines. Returns a list of 5-column
+    rows; empty if the table has no header line.
+    """
+    if not table:
+        return []
+
+    # Normalize every row to exactly 5 columns in one pass up front
+    norm = [row[:5] + [None] * (5 - len(row)) for row in table]
+    df = pd.DataFrame(norm, columns=range(5))
+    s = df.fillna('').astype(str).apply(lambda col: col.str.strip())
+
+    # Only rows after the header line count
+    header_mask = s[0].str.startswith("Date")
+    if not header_mask.any():
+        return []
+    start = header_mask.idxmax() + 1
+    df = df.iloc[start:].reset_index(drop=True)
+    s = s.iloc[start:].reset_index(drop=True)
+
+    # Same substring checks as before, but across the whole row at once
+    joined = s[0].str.cat([s[1], s[2], s[3], s[4]], sep=' ')
+    brought = joined.str.contains("Brought Forward", regex=False)
+    carried = joined.str.contains("Carried Forward", regex=False)
+
+    # Strip/compare each cell exactly once and reuse the mask
+    nonblank = s.ne('')
+    has_key = nonblank[0] | nonblank[1] | nonblank[4]
+    details_only = (nonblank[1] & ~nonblank[0]
+                    & ~nonblank[2] & ~nonblank[3] & ~nonblank[4])
+
+    # A maximal run of consecutive details-only rows is absorbed whole,
+    # whatever its lines say (the old inner scan never re-checked them):
+    # a run preceded by an anchor row continues that row; otherwise the
+    # run's leading Brought Forward lines are skipped, the first other
+    # line starts its own main row and the rest of the run continues it
+    anchor = has_key & ~brought
+    run_start = details_only & ~details_only.shift(fill_value=False)
+    run_id = run_start.cumsum()
+    run_anchored = ((run_start & anchor.shift(fill_value=False))
+                    .groupby(run_id).transform('any') & details_only)
+
+    candidate = details_only & ~run_anchored & ~brought
+    prev_seen = candidate.groupby(run_id).cummax().groupby(run_id).shift(
+        1, fill_value=False)
+    first_main = candidate & ~prev_seen
+
+    cont = run_anchored | (details_only & ~run_anchored & prev_seen)
+    is_main = (anchor & ~details_only) | first_main
+
+    # Baseline precedence: Brought Forward wins over Carried Forward, and
+    # a Carried row absorbed as a continuation doesn't stop the scan, so
+    # only a Carried row reached by the main scan truncates the table
+    breaks = carried & ~brought & ~cont
+    if breaks.any():
+        stop = breaks.idxmax()
+        df = df.iloc[:stop]
+        s = s.iloc[:stop]
+        cont = cont.iloc[:stop]
+        is_main = is_main.iloc[:stop]
+
+    if not is_main.any():
+        return []
+
+    # Segment boundaries over the chain rows (main + continuations); the
+    # string joins stay in Python, only the boundary scan is compiled
+    chain = is_main | cont
+    chain_main = is_main[chain].to_numpy()
+    chain_details = s[1][chain].to_numpy()
+    bounds = np.append(_segment_starts(chain_main), chain_main.size)
+
+    out = df.loc[is_main].copy()
+    out[1] = [
+        '\n'.join(p for p in chain_details[a:b] if p)
+        for a, b in zip(bounds[:-1], bounds[1:])
+    ]
+    return out.to_numpy().tolist()
 
 
 class FileToExcelConverter:
@@ -56,22 +297,109 @@ class FileToExcelConverter:
         if DOCX_SUPPORT:
             self.supported_formats['docx'] = self.convert_docx
 
-    def convert_csv(self, file_path, output_path):
+    def _excel_writer(self, output_path):
+        """Create an ExcelWriter on the fastest available engine"""
+        if XLSXWRITER_SUPPORT:
+            return pd.ExcelWriter(output_path, engine='xlsxwriter')
+        # pandas drives openpyxl through ws.cell(), which write-only
+        # worksheets don't implement, so the fallback stays in normal mode
+        return pd.ExcelWriter(output_path, engine='openpyxl')
+
+    def _write_excel(self, df, output_path):
+        """Write a single-sheet Excel file via the shared writer"""
+        with self._excel_writer(output_path) as writer:
+            df.to_excel(writer, index=False)
+
+    def _read_delimited(self, source, sep=','):
+        """Parse a delimited text source (path or file-like) into a DataFrame"""
+        if PYARROW_SUPPORT:
+            # Arrow's multi-threaded C++ tokenizer is several times faster
+            # than pandas' parser; keep the columns arrow-backed (zero-copy)
+            table = pacsv.read_csv(
+                source,
+                parse_options=pacsv.ParseOptions(delimiter=sep),
+            )
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return pd.read_csv(source, sep=sep, encoding='utf-8-sig')
+
+    def convert_csv(self, source, output_path):
         """Convert CSV to Excel"""
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
-        df.to_excel(output_path, index=False, engine='openpyxl')
+        if _source_size(source) > LARGE_CSV_BYTES:
+            return self._convert_csv_chunked(source, output_path)
+
+        if POLARS_SUPPORT and XLSXWRITER_SUPPORT:
+            # polars parses in Rust and hands rows straight to xlsxwriter
+            pl.read_csv(source).write_excel(output_path, worksheet='Sheet1')
+            return True
+
+        df = self._read_delimited(source)
+        self._write_excel(df, output_path)
+        return True
+
+    def _convert_csv_chunked(self, source, output_path):
+        """Stream a large CSV to Excel one chunk at a time (constant memory)"""
+        from openpyxl import Workbook
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Sheet1')
+
+        header_written = False
+        for chunk in pd.read_csv(source, encoding='utf-8-sig',
+                                 chunksize=CSV_CHUNK_ROWS):
+            if not header_written:
+                ws.append(list(chunk.columns))
+                header_written = True
+            for row in chunk.itertuples(index=False, name=None):
+                ws.append(row)
+
+        wb.save(output_path)
         return True
 
-    def convert_tsv(self, file_path, output_path):
+    def convert_tsv(self, source, output_path):
         """Convert TSV to Excel"""
-        df = pd.read_csv(file_path, sep='\t', encoding='utf-8-sig')
-        df.to_excel(output_path, index=False, engine='openpyxl')
+        if POLARS_SUPPORT and XLSXWRITER_SUPPORT:
+            pl.read_csv(source, separator='\t').write_excel(
+                output_path, worksheet='Sheet1')
+            return True
+
+        df = self._read_delimited(source, sep='\t')
+        self._write_excel(df, output_path)
         return True
 
-    def convert_json(self, file_path, output_path):
+    def _json_is_array(self, source):
+        """True when the document's first non-whitespace byte is '['"""
+        if hasattr(source, 'read'):
+            head = source.read(512)
+            _rewind(source)
+        else:
+            with open(source, 'rb') as f:
+                head = f.read(512)
+        return head.lstrip().startswith(b'[')
+
+    def convert_json(self, source, output_path):
         """Convert JSON to Excel"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Only top-level arrays take the polars path: dict-shaped documents
+        # need the nested-list handling below, which polars would silently
+        # flatten into a single stringified row
+        if POLARS_SUPPORT and XLSXWRITER_SUPPORT and self._json_is_array(source):
+            try:
+                pl.read_json(source).write_excel(output_path,
+                                                 worksheet='Sheet1')
+                return True
+            except Exception:
+                # Unusual structures fall through to the manual handling
+                _rewind(source)
+
+        if hasattr(source, 'read'):
+            raw = source.read()
+            data = orjson.loads(raw) if ORJSON_SUPPORT else json.loads(raw)
+        elif ORJSON_SUPPORT:
+            # orjson parses straight from the mapped bytes, no read() copy
+            with _mmap_source(source) as mm:
+                data = orjson.loads(memoryview(mm))
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         # Handle different JSON structures
         if isinstance(data, list):
@@ -88,199 +416,298 @@ class FileToExcelConverter:
         else:
             raise ValueError("Unsupported JSON structure")
 
-        df.to_excel(output_path, index=False, engine='openpyxl')
+        self._write_excel(df, output_path)
         return True
 
-    def convert_xml(self, file_path, output_path):
-        """Convert XML to Excel"""
-        if not XML_SUPPORT:
-            raise ImportError("BeautifulSoup4 and lxml required for XML conversion")
+    def _xml_frame_streamed(self, source):
+        """Stream XML records into a DataFrame with lxml.iterparse.
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f, 'lxml-xml')
+        Constant memory: each record subtree is freed as soon as its row
+        has been collected, so large feeds never build a full DOM.
+        """
+        from lxml import etree
 
-        # Try to extract tabular data
         rows = []
-        for item in soup.find_all(recursive=False):
+        leaf_fields = {}
+        root = None
+        for _, elem in etree.iterparse(source, events=('end',)):
+            parent = elem.getparent()
+            if parent is None:
+                root = elem
+            elif parent.getparent() is None:
+                if len(elem):
+                    # Direct child of the root with fields: one record
+                    rows.append({child.tag: ''.join(child.itertext())
+                                 for child in elem})
+                else:
+                    # Leaf child of the root: field of a single-row document
+                    leaf_fields[elem.tag] = ''.join(elem.itertext())
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+        if rows and leaf_fields:
+            # Leaf and non-leaf children side by side: the document is one
+            # record whose fields carry inline markup, not a record list
+            mixed = True
+        elif rows and all(len(r) == 1 for r in rows):
+            # Heterogeneous singleton "records" are markup inside scalar
+            # fields too (e.g. <body>Hi <b>there</b></body>)
+            mixed = len({k for r in rows for k in r}) > 1
+        else:
+            mixed = False
+
+        if mixed:
+            _rewind(source)
+            return self._xml_single_record(source)
+        if rows:
+            return pd.DataFrame(rows)
+        if leaf_fields:
+            return pd.DataFrame([leaf_fields])
+        # Fallback: create simple structure
+        text = ''.join(root.itertext()) if root is not None else ''
+        return pd.DataFrame([{'Content': text}])
+
+    def _xml_single_record(self, source):
+        """One row mapping each direct child of the root to its full text"""
+        from lxml import etree
+
+        fields = {}
+        for _, elem in etree.iterparse(source, events=('end',)):
+            parent = elem.getparent()
+            if parent is not None and parent.getparent() is None:
+                fields[elem.tag] = ''.join(elem.itertext())
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+        return pd.DataFrame([fields])
+
+    def _xml_frame_soup(self, source):
+        """Parse XML with BeautifulSoup (lenient fallback)"""
+        parser = 'lxml-xml' if LXML_SUPPORT else 'html.parser'
+        if hasattr(source, 'read'):
+            soup = BeautifulSoup(source, parser)
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                soup = BeautifulSoup(f, parser)
+
+        # Try to extract tabular data; iterating .children skips bs4's
+        # find_all filter machinery on both tree levels
+        rows = []
+        for item in soup.children:
+            if not isinstance(item, Tag):
+                continue
             row_data = {}
-            for child in item.find_all(recursive=False):
-                row_data[child.name] = child.text
+            for child in item.children:
+                if isinstance(child, Tag):
+                    row_data[child.name] = child.get_text()
             if row_data:
                 rows.append(row_data)
 
         if rows:
-            df = pd.DataFrame(rows)
+            return pd.DataFrame(rows)
+        # Fallback: create simple structure
+        return pd.DataFrame([{'Content': soup.get_text()}])
+
+    def convert_xml(self, source, output_path):
+        """Convert XML to Excel"""
+        if LXML_SUPPORT:
+            try:
+                df = self._xml_frame_streamed(source)
+            except Exception:
+                # lxml's parser is strict; retry leniently with soup
+                if not BS4_SUPPORT:
+                    raise
+                _rewind(source)
+                df = self._xml_frame_soup(source)
+        elif BS4_SUPPORT:
+            df = self._xml_frame_soup(source)
         else:
-            # Fallback: create simple structure
-            df = pd.DataFrame([{'Content': soup.get_text()}])
+            raise ImportError("lxml or BeautifulSoup4 required for XML conversion")
 
-        df.to_excel(output_path, index=False, engine='openpyxl')
+        self._write_excel(df, output_path)
         return True
 
-    def convert_html(self, file_path, output_path):
+    def _html_tables_lxml(self, source):
+        """Extract HTML tables with a direct lxml walk (no pandas overhead)"""
+        from lxml import html as lhtml
+
+        tree = lhtml.parse(source)
+        tables = []
+        for tbl in tree.xpath('//table'):
+            # Only this table's own rows, not rows of tables nested in it
+            rows = [
+                [cell.text_content().strip() for cell in tr.xpath('./td|./th')]
+                for tr in tbl.xpath('./thead/tr|./tbody/tr|./tfoot/tr|./tr')
+            ]
+            rows = [r for r in rows if r]
+            if not rows:
+                continue
+
+            # Pad ragged rows (colspan headers etc.) to the table's width
+            width = max(len(r) for r in rows)
+            rows = [r + [None] * (width - len(r)) for r in rows]
+
+            if len(rows) > 1:
+                tables.append(pd.DataFrame(rows[1:], columns=rows[0]))
+            else:
+                tables.append(pd.DataFrame(rows))
+        return tables
+
+    def convert_html(self, source, output_path):
         """Convert HTML tables to Excel"""
-        tables = pd.read_html(file_path)
+        if LXML_SUPPORT:
+            tables = self._html_tables_lxml(source)
+        else:
+            tables = pd.read_html(source)
 
         if not tables:
             raise ValueError("No tables found in HTML file")
 
         # If multiple tables, save to different sheets
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with self._excel_writer(output_path) as writer:
             for i, table in enumerate(tables):
                 sheet_name = f'Table_{i+1}'
                 table.to_excel(writer, sheet_name=sheet_name, index=False)
 
         return True
 
-    def convert_txt(self, file_path, output_path):
+    def convert_txt(self, source, output_path):
         """Convert TXT to Excel (assumes tabular data)"""
         try:
             # Try comma delimiter
-            df = pd.read_csv(file_path, encoding='utf-8-sig')
+            df = self._read_delimited(source)
         except:
             try:
                 # Try tab delimiter
-                df = pd.read_csv(file_path, sep='\t', encoding='utf-8-sig')
+                _rewind(source)
+                df = self._read_delimited(source, sep='\t')
             except:
                 # Read as plain text
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
+                _rewind(source)
+                if hasattr(source, 'read'):
+                    lines = source.read().decode('utf-8').splitlines(keepends=True)
+                else:
+                    with open(source, 'r', encoding='utf-8') as f:
+                        lines = f.readlines()
                 df = pd.DataFrame({'Content': lines})
 
-        df.to_excel(output_path, index=False, engine='openpyxl')
+        self._write_excel(df, output_path)
         return True
 
-    def convert_pdf(self, file_path, output_path):
+    def convert_pdf(self, source, output_path):
         """Convert PDF to Excel - use explicit column boundaries with merged Details rows"""
+        import multiprocessing
         import pdfplumber
-        import pandas as pd
+        from functools import partial
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Alignment
-              
+
         HEADERS = ["Date", "Transaction Details", "Debits", "Credits", "Balance"]
 
-        with pdfplumber.open(file_path) as pdf:
-            first_page = pdf.pages[0]
-
-            explicit_vertical_lines = [60, 125.0, 270, 345, 450, 555]
-            #print(f"Using default boundaries: {explicit_vertical_lines}")
-
-            table_settings = {
-                "vertical_strategy": "explicit",
-                "horizontal_strategy": "text",
-                "explicit_vertical_lines": explicit_vertical_lines,
-                "text_tolerance": 3,
-                "intersection_x_tolerance": 50,
-                "text_y_tolerance": 5,  # Keep this lower
-            }
-
-            all_rows = []
-
-            for page in pdf.pages:
-                page_tables = page.extract_tables(table_settings=table_settings)
-
-                for table in page_tables:
-                    if not table or len(table) == 0:
-                        continue
-
-                    header_idx = None
-                    for i, row in enumerate(table):
-                        if row and row[0] and str(row[0]).strip().startswith("Date"):
-                            header_idx = i
-                            break
-
-                    if header_idx is None:
-                        continue
-
-                    i = header_idx + 1
-                    while i < len(table):
-                        row = table[i]
-                        #print(row)
-                        if not row or all(not cell or not str(cell).strip() for cell in row):
-                            i += 1
-                            continue
-
-                        # Normalize row length to 7 columns
-                        if len(row) < 5:
-                            row = row + [None] * (5 - len(row))
-                        elif len(row) > 5:
-                            row = row[:5]
-
-                        first_cell = str(row).strip()
-
-                        if "Brought Forward" in first_cell:
-                            i += 1
-                            continue
-
-                        if "Carried Forward" in first_cell:
-                            break
-
-                        # Determine if this is a main row (has key identifying fields)
-                        has_key_fields = (row[0] and str(row[0]).strip()) or \
-                                        (row[1] and str(row[1]).strip()) or \
-                                        (row[4] and str(row[4]).strip()) 
-
-                        if has_key_fields:
-                            details_parts = [str(row[1]).strip() if row[1] else ""]
-
-                            j = i + 1
-                            while j < len(table):
-                                next_row = table[j]
-                                if len(next_row) < 5:
-                                    next_row = next_row + [None] * (5 - len(next_row))
-
-                                next_has_details = next_row[1] and str(next_row[1]).strip()
-                                next_empty_elsewhere = all(
-                                    not next_row[k] or not str(next_row[k]).strip()
-                                    for k in [0, 2, 3, 4]
-                                )
-
-                                if next_has_details and next_empty_elsewhere:
-                                    details_parts.append(str(next_row[1]).strip())
-                                    j += 1
-                                else:
-                                    break
-
-                            row[1] = "\n".join([p for p in details_parts if p])
-                            all_rows.append(row)
-                            i = j
-                        else:
-                            i += 1
-
-            if not all_rows:
-                raise ValueError("No tables found in PDF")
-
-            df = pd.DataFrame(all_rows, columns=HEADERS)
-            df = df.dropna(how='all')
-
-            wb = Workbook()
-            ws = wb.active
-            ws.title = 'All_Data'
-
-            for col_idx, col_name in enumerate(HEADERS, start=1):
-                cell = ws.cell(row=1, column=col_idx, value=col_name)
-                cell.alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
-
-            for row_idx, row in enumerate(df.iterrows(), start=2):
-                for col_idx, value in enumerate(row[1], start=1):
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
-
-            wb.save(output_path)
+        # Workers reopen the document themselves, so hand them the raw
+        # bytes when the source is an in-memory stream
+        pdf_source = source.read() if hasattr(source, 'read') else source
+
+        explicit_vertical_lines = [60, 125.0, 270, 345, 450, 555]
+        #print(f"Using default boundaries: {explicit_vertical_lines}")
+
+        table_settings = {
+            "vertical_strategy": "explicit",
+            "horizontal_strategy": "text",
+            "explicit_vertical_lines": explicit_vertical_lines,
+            "text_tolerance": 3,
+            "intersection_x_tolerance": 50,
+            "text_y_tolerance": 5,  # Keep this lower
+        }
+
+        with pdfplumber.open(io.BytesIO(pdf_source)
+                             if isinstance(pdf_source, bytes)
+                             else _mmap_source(pdf_source)) as pdf:
+            n_pages = len(pdf.pages)
+
+        # Pages are independent and parsing is CPU-bound, so spread
+        # multi-page documents across worker processes - unless this
+        # conversion already runs inside a batch worker, where a nested
+        # pool would oversubscribe the machine
+        in_worker = multiprocessing.parent_process() is not None
+        if n_pages > 1 and not in_worker:
+            extract = partial(_extract_page_rows, pdf_source,
+                              table_settings=table_settings)
+            with ProcessPoolExecutor(
+                max_workers=min(n_pages, os.cpu_count() or 1)
+            ) as executor:
+                page_rows = executor.map(extract, range(n_pages))
+                all_rows = [row for rows in page_rows for row in rows]
+        else:
+            all_rows = [
+                row
+                for page_no in range(n_pages)
+                for row in _extract_page_rows(pdf_source, page_no, table_settings)
+            ]
+
+        if not all_rows:
+            raise ValueError("No tables found in PDF")
+
+        # Column-oriented assembly: pandas builds each column from one
+        # list instead of transposing a list of rows cell by cell
+        cols = {h: [row[k] for row in all_rows] for k, h in enumerate(HEADERS)}
+        df = pd.DataFrame(cols, copy=False)
+        df = df.dropna(how='all')
+        # Blank cells come through as NaN, which xlsxwriter refuses to
+        # write as numbers; hand both writers None so they emit blanks
+        df = df.astype(object).where(pd.notna(df), None)
+
+        if XLSXWRITER_SUPPORT:
+            # xlsxwriter streams rows out in constant memory and reuses a
+            # single format object instead of allocating one per cell
+            wb = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+            ws = wb.add_worksheet('All_Data')
+            wrap_format = wb.add_format({'text_wrap': True, 'valign': 'top', 'align': 'left'})
+
+            ws.write_row(0, 0, HEADERS, wrap_format)
+            for row_idx, tup in enumerate(df.itertuples(index=False, name=None), start=1):
+                ws.write_row(row_idx, 0, tup, wrap_format)
+
+            wb.close()
             return True
 
-    def convert_docx(self, file_path, output_path):
+        # Write-only mode appends whole rows and skips the per-cell
+        # coordinate and dimension tracking of ws.cell(row=..., column=...)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('All_Data')
+
+        # One shared style instead of a fresh Alignment per cell
+        wrap_alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
+
+        def styled_row(values):
+            row = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.alignment = wrap_alignment
+                row.append(cell)
+            return row
+
+        ws.append(styled_row(HEADERS))
+        for tup in df.itertuples(index=False, name=None):
+            ws.append(styled_row(tup))
+
+        wb.save(output_path)
+        return True
+
+    def convert_docx(self, source, output_path):
         """Convert DOCX tables to Excel"""
         if not DOCX_SUPPORT:
             raise ImportError("python-docx required for DOCX conversion")
 
-        doc = Document(file_path)
+        doc = Document(source)
         tables = doc.tables
 
         if not tables:
             raise ValueError("No tables found in DOCX file")
 
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with self._excel_writer(output_path) as writer:
             for i, table in enumerate(tables):
                 data = []
                 for row in table.rows:
@@ -293,8 +720,13 @@ class FileToExcelConverter:
 
         return True
 
-    def convert_file(self, input_path, output_dir):
-        """Main conversion method"""
+    def convert_file(self, input_path, output_dir, data=None):
+        """Main conversion method
+
+        `data` optionally carries the file's bytes (pre-read by the GUI
+        prefetcher); converters then parse from memory instead of
+        re-reading the path.
+        """
         input_path = Path(input_path)
         extension = input_path.suffix.lower().replace('.', '')
 
@@ -305,9 +737,15 @@ class FileToExcelConverter:
         output_filename = f"{input_path.stem}_converted.xlsx"
         output_path = Path(output_dir) / output_filename
 
-        # Perform conversion
+        # Perform conversion. PDFs always go by path: their page workers
+        # reopen the file themselves, and handing them prefetched bytes
+        # would pickle the whole document once per page task
         converter_func = self.supported_formats[extension]
-        converter_func(str(input_path), str(output_path))
+        if data is not None and extension != 'pdf':
+            source = io.BytesIO(data)
+        else:
+            source = str(input_path)
+        converter_func(source, str(output_path))
 
         return str(output_path)
 
@@ -483,36 +921,113 @@ class ConverterGUI:
             messagebox.showwarning("No Output", "Please select an output directory")
             return
 
+        # Widget updates happen only on the Tk main thread: the worker
+        # posts events to a queue that we drain from the after() loop
+        self.convert_button.config(state='disabled')
+        self.progress_bar.config(maximum=len(self.selected_files), value=0)
+        self.progress_queue = queue.Queue()
+
         # Run conversion in separate thread
         thread = threading.Thread(target=self.convert_files, daemon=True)
         thread.start()
 
+        self.root.after(50, self.poll_progress)
+
+    def poll_progress(self):
+        """Drain conversion events on the Tk main thread"""
+        while True:
+            try:
+                event = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if event[0] == 'progress':
+                _, done, status = event
+                self.progress_bar['value'] = done
+                self.status_label.config(text=status)
+            else:  # 'done'
+                _, success_count, total, failed_files = event
+                self.show_completion(success_count, total, failed_files)
+                return
+
+        self.root.after(50, self.poll_progress)
+
     def convert_files(self):
-        """Convert all selected files"""
+        """Convert all selected files in parallel across a worker pool"""
         total = len(self.selected_files)
         success_count = 0
         failed_files = []
 
-        self.convert_button.config(state='disabled')
-        self.progress_bar['value'] = 0
-        self.progress_bar['maximum'] = total
-
-        for i, file_path in enumerate(self.selected_files):
-            filename = Path(file_path).name
-            self.status_label.config(text=f"Converting: {filename}")
-
+        # Each file conversion is independent. PDF batches are CPU-bound
+        # (parsing + xlsx serialization), so use processes to bypass the GIL;
+        # lighter formats are fine on threads.
+        has_pdf = any(Path(f).suffix.lower() == '.pdf' for f in self.selected_files)
+        executor_cls = ProcessPoolExecutor if has_pdf else ThreadPoolExecutor
+        max_workers = min(total, os.cpu_count() or 1)
+
+        # Read the next inputs from disk while conversions are running
+        buf_queue = queue.Queue(maxsize=2)
+        prefetcher = threading.Thread(
+            target=self.prefetch_files,
+            args=(list(self.selected_files), buf_queue),
+            daemon=True,
+        )
+        prefetcher.start()
+
+        done = 0
+
+        def drain(finished):
+            nonlocal done, success_count
+            for future in finished:
+                filename = Path(futures[future]).name
+                error = future.exception()
+                if error is None:
+                    success_count += 1
+                    status = f"Converted: {filename}"
+                else:
+                    failed_files.append((filename, str(error)))
+                    status = f"Failed: {filename}"
+
+                done += 1
+                self.progress_queue.put(('progress', done, status))
+
+        with executor_cls(max_workers=max_workers) as executor:
+            futures = {}
+            pending = set()
+
+            for _ in range(total):
+                file_path, data = buf_queue.get()
+                future = executor.submit(self.converter.convert_file,
+                                         file_path, self.output_directory, data)
+                futures[future] = file_path
+                pending.add(future)
+
+                # Cap in-flight work so prefetched bytes don't pile up
+                if len(pending) >= max_workers + 2:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    drain(finished)
+
+            drain(as_completed(pending))
+
+        self.progress_queue.put(('done', success_count, total, failed_files))
+
+    def prefetch_files(self, paths, buf_queue):
+        """Read input files ahead of conversion so disk and CPU overlap"""
+        for path in paths:
             try:
-                output_path = self.converter.convert_file(file_path, self.output_directory)
-                success_count += 1
-                self.status_label.config(text=f"Converted: {filename}")
-            except Exception as e:
-                failed_files.append((filename, str(e)))
-                self.status_label.config(text=f"Failed: {filename}")
-
-            self.progress_bar['value'] = i + 1
-            self.root.update_idletasks()
-
-        # Show completion message
+                # Inputs big enough for the chunked/streaming paths keep
+                # reading from disk; materializing them here would undo that
+                if os.path.getsize(path) > LARGE_CSV_BYTES:
+                    data = None
+                else:
+                    data = Path(path).read_bytes()
+            except OSError:
+                # Let the converter surface the real error from the path
+                data = None
+            buf_queue.put((path, data))
+
+    def show_completion(self, success_count, total, failed_files):
+        """Show completion message and reset the UI (main thread only)"""
         self.convert_button.config(state='normal')
 
         message = f"Conversion complete!\n\nSuccessful: {success_count}/{total}"